@@ -1,6 +1,122 @@
-import datetime
+import time
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for Engine.simulate_batch
+    np = None
+
+# Tick rate (Hz) the per-tick RPM increase/decay rates are tuned for
+BASE_TICK_RATE = 60
+
+# RPM snaps to the target once it is this close, so it settles instead of approaching it forever
+RPM_SNAP_THRESHOLD = 0.5
+
+
+@njit(cache=True, fastmath=True)
+def _torque(current_rpm, peak_torque_rpm, inv_peak_torque_rpm, inv_post_peak_range,
+            max_torque_nm, min_torque):
+    """
+    Torque curve (Nm) for the given RPM. See Engine.calculate_current_torque.
+    """
+    if current_rpm == 0:
+        return 0.0
+
+    if current_rpm <= peak_torque_rpm:
+        # Torque increases until peak torque RPM
+        torque_nm = max_torque_nm * (current_rpm * inv_peak_torque_rpm)
+    else:
+        # Torque decreases more gradually after peak torque RPM
+        rpm_post_peak = current_rpm - peak_torque_rpm
+        decrease_factor = 1 - (rpm_post_peak * inv_post_peak_range) ** 2
+        torque_nm = max_torque_nm * decrease_factor
+
+    # Prevent torque from dropping below 30% of max torque
+    return max(torque_nm, min_torque)
+
+
+@njit(cache=True, fastmath=True)
+def _hp(current_rpm, current_torque_nm, torque_to_hp_k, max_hp):
+    """
+    Horsepower for the given RPM and torque (Nm). See Engine.calculate_current_hp.
+    """
+    if current_rpm == 0:
+        return 0.0
+
+    # HP = torque (ft-lb) * RPM / 5252, with the Nm -> ft-lb conversion folded into torque_to_hp_k
+    hp = current_torque_nm * current_rpm * torque_to_hp_k
+
+    # Clamp HP to not exceed max horsepower
+    return min(hp, float(max_hp))
+
+
+@njit(cache=True, fastmath=True)
+def _tick(current_rpm, throttle, target_rpm_k, max_rpm, inv_max_rpm,
+          peak_torque_rpm, inv_peak_torque_rpm, inv_post_peak_range,
+          max_torque_nm, min_torque, torque_to_hp_k, max_hp,
+          increase_rate, clutched):
+    """
+    One simulation step on plain numbers. Returns the new (rpm, torque, hp).
+    See Engine.update_rpm for the model.
+    """
+    # Calculate the target RPM based on throttle and gear ratio
+    target_rpm = float(int(target_rpm_k * throttle))
+    rpm = float(current_rpm)
+
+    if target_rpm > rpm:
+        # Gradual increase to target RPM
+        rpm_increase = (target_rpm - rpm) * increase_rate
+
+        # Slow down RPM increase as it approaches the max RPM using a decay factor
+        decay_factor = 1 - ((rpm * inv_max_rpm) ** 2)
+        rpm = min(rpm + rpm_increase * decay_factor, target_rpm)
+    else:
+        # Simulate RPM decay when throttle is released
+        if rpm > 700:
+            if clutched:
+                decay_rate = (rpm - target_rpm) * increase_rate
+            else:
+                decay_rate = (rpm - target_rpm) * increase_rate / 10
+            rpm -= decay_rate
+
+    # Snap to where the RPM settles, the target or max RPM if the target is above it
+    settle_rpm = min(target_rpm, float(max_rpm))
+    if abs(settle_rpm - rpm) < RPM_SNAP_THRESHOLD:
+        rpm = settle_rpm
+
+    # Keep RPM between idle and maximum
+    rpm = min(max(rpm, 700.0), float(max_rpm))
+
+    torque_nm = _torque(rpm, peak_torque_rpm, inv_peak_torque_rpm, inv_post_peak_range,
+                        max_torque_nm, min_torque)
+    hp = _hp(rpm, torque_nm, torque_to_hp_k, max_hp)
+    return rpm, torque_nm, hp
+
+
+try:
+    # Ahead-of-time compiled tick, see engine_core.pyx
+    from engine_core import tick as _tick
+except ImportError:  # Extension not built, use the Numba/Python version above
+    pass
+
 
 class Engine:
+    __slots__ = ('name', 'manufacturer', 'description',
+                 'cylinders', 'displacement', 'cylinder_bore', 'piston_stroke', 'compression_ratio',
+                 'max_rpm', 'max_horsepower', 'max_kw', 'max_torque_nm', 'RON', 'ECS',
+                 'peak_torque_rpm', 'peak_hp_rpm', 'clutch_response_time',
+                 'current_hp', 'current_torque_nm', 'current_rpm', 'throttle', 'throttle_decay_rate',
+                 'increase_rate', 'base_increase_rate', 'current_gear_ratio', 'clutched', 'clutched_timestamp_ns',
+                 '_torque_to_hp_k', '_inv_peak_torque_rpm', '_inv_post_peak_range', '_min_torque',
+                 '_inv_max_rpm', '_target_rpm_k', '_last_inputs', '_last_rpm')
+
     def __init__(self, name: str, manufacturer: str, description: str, 
                  cylinders: int, displacement: int, cylinder_bore: float, 
                  piston_stroke: float, compression_ratio: float, 
@@ -38,7 +154,19 @@ class Engine:
         self.base_increase_rate: float = 0.03
         self.current_gear_ratio: float = None
         self.clutched: bool = False # Engine can only generate power to the gearbox if clutch is False
-        self.clutched_timestamp: datetime = None
+        self.clutched_timestamp_ns: int = None # time.monotonic_ns() when the clutch was pressed
+
+        # Precomputed constants for the per-tick math
+        self._torque_to_hp_k: float = 0.737562 / 5252.0  # Nm -> ft-lb, then ft-lb * RPM / 5252
+        self._inv_peak_torque_rpm: float = 1.0 / peak_torque_rpm
+        self._inv_post_peak_range: float = 1.0 / (max_rpm - peak_torque_rpm) if max_rpm > peak_torque_rpm else 0.0
+        self._min_torque: float = max_torque_nm * 0.3  # Torque never drops below 30% of max torque
+        self._inv_max_rpm: float = 1.0 / max_rpm
+        self._target_rpm_k: float = None  # max_rpm * current gear ratio, set by calculate_increase_rate
+
+        # Steady state: (throttle, gear ratio, clutched, dt) and the RPM for which the last tick changed nothing
+        self._last_inputs: tuple = None
+        self._last_rpm: float = None
 
     def calculate_increase_rate(self, gear_ratio: float):
         """
@@ -54,61 +182,106 @@ class Engine:
         """
         self.current_gear_ratio = gear_ratio
         self.increase_rate = self.base_increase_rate * gear_ratio / 2
+        self._target_rpm_k = self.max_rpm * gear_ratio
 
-    def update_rpm(self):
+    def update_rpm(self, dt: float = 1 / BASE_TICK_RATE):
         """
         Updates the current RPM based on the throttle input.
         Simulates a more realistic non-linear increase and decrease in RPM,
         including slower increases near maximum RPM, and considering gear ratios.
         
         Args:
-            gear_ratio (float): The current gear ratio which affects RPM increase. Higher gear ratios
-                                (lower gears) allow faster RPM increases, while lower gear ratios 
-                                (higher gears) make it harder to reach max RPM.
+            dt (float): The simulated time step in seconds. The RPM increase and decay rates
+                        are scaled by it, so the engine responds the same at any tick rate.
         """
         if self.clutched is True:
             self.throttle = 0.0
-            if self.clutched_timestamp is None:
-                self.clutched_timestamp = datetime.datetime.now()
+            if self.clutched_timestamp_ns is None:
+                self.clutched_timestamp_ns = time.monotonic_ns()
             else:
-                # Check if the difference between now and clutched_timestamp is greater than 1 second
-                if datetime.datetime.now() - self.clutched_timestamp > datetime.timedelta(milliseconds=self.clutch_response_time):
+                # Release the clutch once the clutch response time (ms) has passed
+                if time.monotonic_ns() - self.clutched_timestamp_ns > self.clutch_response_time * 1_000_000:
                     self.clutched = False
-                    self.clutched_timestamp = None
-        
-        # Calculate the target RPM based on throttle and gear ratio
-        target_rpm = int(self.max_rpm * self.throttle * self.current_gear_ratio)
-        
-        if target_rpm > self.current_rpm:
-            # Simulate RPM increase with a non-linear approach
-            if self.current_rpm < target_rpm:
-                # Gradual increase to target RPM
-                increase_rate = (target_rpm - self.current_rpm) * self.increase_rate
-                
-                # Slow down RPM increase as it approaches the max RPM using a decay factor
-                decay_factor = 1 - ((self.current_rpm / self.max_rpm) ** 2)
-                self.current_rpm += increase_rate * decay_factor
-                
-                if self.current_rpm > target_rpm:
-                    self.current_rpm = target_rpm
+                    self.clutched_timestamp_ns = None
+
+        # Skip the tick if the last one with the same inputs left the RPM unchanged
+        inputs = (self.throttle, self.current_gear_ratio, self.clutched, dt)
+        if self.current_rpm == self._last_rpm and inputs == self._last_inputs:
+            return
+
+        previous_rpm = self.current_rpm
+        self.current_rpm, self.current_torque_nm, self.current_hp = _tick(
+            self.current_rpm, self.throttle, self._target_rpm_k,
+            self.max_rpm, self._inv_max_rpm,
+            self.peak_torque_rpm, self._inv_peak_torque_rpm, self._inv_post_peak_range,
+            self.max_torque_nm, self._min_torque, self._torque_to_hp_k,
+            self.max_horsepower, self.increase_rate * dt * BASE_TICK_RATE, self.clutched)
+
+        if self.current_rpm == previous_rpm:
+            self._last_inputs = inputs
+            self._last_rpm = self.current_rpm
         else:
-            # Simulate RPM decay when throttle is released
-            if self.current_rpm > 700:
-                if self.clutched == False:
-                    decay_rate = float(self.current_rpm - target_rpm) * self.increase_rate / 10 # Fixed rate for RPM decay
-                elif self.clutched == True:
-                    decay_rate = float(self.current_rpm - target_rpm) * self.increase_rate # Fixed rate for RPM decay
-                self.current_rpm -= decay_rate
-                if self.current_rpm < 700:
-                    self.current_rpm = 700
-
-        # Ensure RPM doesn't exceed maximum
-        if self.current_rpm > self.max_rpm:
-            self.current_rpm = self.max_rpm
-
-        # Update HP and Torque
-        self.calculate_current_torque()
-        self.calculate_current_hp()
+            self._last_inputs = None
+            self._last_rpm = None
+
+    def simulate_batch(self, throttle: "np.ndarray", gear_ratio: "np.ndarray", n_steps: int,
+                       dt: float = 1 / BASE_TICK_RATE) -> "dict[str, np.ndarray]":
+        """
+        Simulates N independent trajectories from idle at once, using the same model as
+        update_rpm with the clutch pedal released (clutched is False). Each step is one
+        update_rpm(dt) tick. The steps run sequentially, each step is vectorized over the
+        trajectories. The engine's own state is not modified.
+
+        Args:
+            throttle (np.ndarray): Throttle per trajectory, shape (N,), or per step and
+                                   trajectory, shape (n_steps, N).
+            gear_ratio (np.ndarray): Gear ratio per trajectory, shape (N,).
+            n_steps (int): Number of simulation steps.
+            dt (float): The simulated time step in seconds, as in update_rpm. Defaults to
+                        one 1/BASE_TICK_RATE tick.
+
+        Returns:
+            dict[str, np.ndarray]: 'rpm', 'torque_nm' and 'hp', each of shape (n_steps, N).
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("Engine.simulate_batch requires NumPy.")
+
+        gear_ratio = np.asarray(gear_ratio, dtype=np.float64)
+        throttle = np.broadcast_to(np.asarray(throttle, dtype=np.float64), (n_steps, gear_ratio.shape[0]))
+        increase_rate = self.base_increase_rate * gear_ratio / 2 * (dt * BASE_TICK_RATE)
+        target_rpm_k = self.max_rpm * gear_ratio
+
+        rpm = np.full(gear_ratio.shape[0], 700.0)
+        rpm_out = np.empty((n_steps, gear_ratio.shape[0]))
+        for t in range(n_steps):
+            target_rpm = np.trunc(target_rpm_k * throttle[t])
+
+            # Gradual increase to target RPM, slowing down near max RPM
+            rpm_up = rpm + (target_rpm - rpm) * increase_rate * (1 - (rpm * self._inv_max_rpm) ** 2)
+            rpm_up = np.minimum(rpm_up, target_rpm)
+
+            # RPM decay when throttle is released, never below idle
+            rpm_down = np.maximum(rpm - (rpm - target_rpm) * increase_rate / 10, 700.0)
+            rpm_down = np.where(rpm > 700, rpm_down, rpm)
+
+            rpm = np.where(target_rpm > rpm, rpm_up, rpm_down)
+            settle_rpm = np.minimum(target_rpm, self.max_rpm)
+            rpm = np.where(np.abs(settle_rpm - rpm) < RPM_SNAP_THRESHOLD, settle_rpm, rpm)
+            rpm = np.minimum(np.maximum(rpm, 700.0), self.max_rpm)
+            rpm_out[t] = rpm
+
+        # Torque and HP only depend on the RPM, so compute them for all steps at once
+        torque_nm = np.where(
+            rpm_out <= self.peak_torque_rpm,
+            self.max_torque_nm * (rpm_out * self._inv_peak_torque_rpm),
+            self.max_torque_nm * (1 - ((rpm_out - self.peak_torque_rpm) * self._inv_post_peak_range) ** 2))
+        torque_nm = np.maximum(torque_nm, self._min_torque)
+        hp = np.minimum(torque_nm * rpm_out * self._torque_to_hp_k, self.max_horsepower)
+
+        return {'rpm': rpm_out, 'torque_nm': torque_nm, 'hp': hp}
 
     def calculate_current_hp(self) -> float:
         """
@@ -120,16 +293,8 @@ class Engine:
         if self.current_rpm == 0:
             return 0.0
 
-        # Convert torque from Nm to ft-lb
-        current_torque_ft_lb = self.current_torque_nm * 0.737562
-
-        # Correct formula to calculate HP using RPM and torque in ft-lb
-        self.current_hp = (current_torque_ft_lb * self.current_rpm) / 5252
-
-        # Clamp HP to not exceed max horsepower, if necessary
-        if self.current_hp > self.max_horsepower:
-            self.current_hp = self.max_horsepower
-
+        self.current_hp = _hp(self.current_rpm, self.current_torque_nm,
+                              self._torque_to_hp_k, self.max_horsepower)
         return self.current_hp
 
     def calculate_current_torque(self) -> float:
@@ -143,18 +308,7 @@ class Engine:
         if self.current_rpm == 0:
             return 0.0
 
-        if self.current_rpm <= self.peak_torque_rpm:
-            # Torque increases until peak torque RPM
-            self.current_torque_nm = self.max_torque_nm * (self.current_rpm / self.peak_torque_rpm)
-        else:
-            # Torque decreases more gradually after peak torque RPM
-            rpm_range = self.max_rpm - self.peak_torque_rpm
-            rpm_post_peak = self.current_rpm - self.peak_torque_rpm
-            decrease_factor = 1 - (rpm_post_peak / rpm_range) ** 2
-            self.current_torque_nm = self.max_torque_nm * decrease_factor
-
-        # Prevent torque from dropping below 30% of max torque
-        min_torque = self.max_torque_nm * 0.3
-        self.current_torque_nm = max(self.current_torque_nm, min_torque)
-
+        self.current_torque_nm = _torque(self.current_rpm, self.peak_torque_rpm,
+                                         self._inv_peak_torque_rpm, self._inv_post_peak_range,
+                                         self.max_torque_nm, self._min_torque)
         return self.current_torque_nm
@@ -1,17 +1,29 @@
+import math
+import re
+
+# Tire size in 'Width/AspectRatioRDiameter' format, e.g. '195/50R16' or '195/55ZR16'
+_TIRE_RE = re.compile(r'(\d+)/(\d+)Z?R(\d+)')
+
 class Gearbox:
+    __slots__ = ('gear_ratios', 'current_gear', 'tire_radius_meters', 'final_drive_ratio', '_speed_per_rpm')
+
     def __init__(self, gear_ratios: list, tire_size: str, final_drive_ratio: float):
         """
         Initializes the Gearbox with gear ratios and tire size.
 
-        :param gear_ratios: List of gear ratios, where the index corresponds to the gear number.
+        :param gear_ratios: Sequence of gear ratios, where the index corresponds to the gear number.
         :param tire_size: The tire size in the format 'Width/AspectRatioRDiameter', e.g., '195/50R16'.
         :param final_drive_ratio: The final drive ratio of the gearbox.
         """
-        self.gear_ratios = gear_ratios
+        self.gear_ratios = tuple(gear_ratios)
         self.current_gear = 1
         self.tire_radius_meters = self.get_wheel_radius(tire_size)
         self.final_drive_ratio = final_drive_ratio
 
+        # Speed in km/h per engine RPM for each gear
+        self._speed_per_rpm = tuple((self.tire_radius_meters * 2.0 * math.pi * 60.0) / (final_drive_ratio * g * 1000.0)
+                                    for g in self.gear_ratios)
+
     def shift_up(self):
         """
         Shifts the gearbox up one gear, if not already in the highest gear.
@@ -35,37 +47,29 @@ class Gearbox:
 
         Args:
             tire_size (str): The tire size in the format 'Width/AspectRatioRDiameter', 
-                            e.g., '195/50R16'.
+                            e.g., '195/50R16' or '195/55ZR16'.
 
         Returns:
             float: The wheel radius in meters.
 
         Raises:
-            ValueError: If the tire size format is invalid or if the values are not convertible to integers.
+            ValueError: If the tire size format is invalid.
         """
-        try:
-            # Split the tire size string into its components
-            width_str, aspect_ratio_and_diameter = tire_size.split('/')
-            aspect_ratio_str, diameter_str = aspect_ratio_and_diameter.split('R')
-            
-            # Convert the string components to integers
-            width = int(width_str)
-            aspect_ratio = int(aspect_ratio_str)
-            diameter = int(diameter_str)
-            
-            # Calculate the sidewall height in millimeters
-            sidewall_height_mm = (width * aspect_ratio) / 100
-            
-            # Convert sidewall height to meters
-            sidewall_height_m = sidewall_height_mm / 1000
-            
-            # Calculate the wheel radius in meters
-            wheel_radius_m = (diameter * 25.4 / 2) / 1000
-            
-            return wheel_radius_m
-        
-        except (ValueError, IndexError) as e:
-            raise ValueError("Invalid tire size format. Ensure it is in 'Width/AspectRatioRDiameter' format.") from e
+        match = _TIRE_RE.fullmatch(tire_size.strip())
+        if not match:
+            raise ValueError("Invalid tire size format. Ensure it is in 'Width/AspectRatioRDiameter' format.")
+        width, aspect_ratio, diameter = map(int, match.groups())
+
+        # Calculate the sidewall height in millimeters
+        sidewall_height_mm = (width * aspect_ratio) / 100
+
+        # Convert sidewall height to meters
+        sidewall_height_m = sidewall_height_mm / 1000
+
+        # Calculate the wheel radius in meters
+        wheel_radius_m = (diameter * 25.4 / 2) / 1000
+
+        return wheel_radius_m
 
     def get_speed(self, engine_rpm: int) -> float:
         """
@@ -74,9 +78,4 @@ class Gearbox:
         :param engine_rpm: The current RPM of the engine.
         :return: The approximate speed in km/h.
         """
-        gear_ratio = self.gear_ratios[self.current_gear - 1]
-        
-        # Calculate the speed in km/h
-        speed_kph = (engine_rpm * self.tire_radius_meters * 2 * 3.14159 * 60) / (self.final_drive_ratio * gear_ratio * 1000)
-        
-        return speed_kph
+        return engine_rpm * self._speed_per_rpm[self.current_gear - 1]
@@ -0,0 +1,76 @@
+# cython: language_level=3
+"""
+Ahead-of-time compiled version of the engine physics tick (Engine._tick).
+Engine.py uses it instead of the Numba/Python version when it is built.
+
+Build it in place with: cythonize -i engine_core.pyx
+"""
+cimport cython
+
+# Keep in step with Engine.RPM_SNAP_THRESHOLD
+cdef double RPM_SNAP_THRESHOLD = 0.5
+
+
+@cython.cdivision(True)
+cdef inline double _torque(double current_rpm, double peak_torque_rpm, double inv_peak_torque_rpm,
+                           double inv_post_peak_range, double max_torque_nm, double min_torque):
+    cdef double torque_nm, rpm_post_peak_k
+
+    if current_rpm == 0:
+        return 0.0
+
+    if current_rpm <= peak_torque_rpm:
+        # Torque increases until peak torque RPM
+        torque_nm = max_torque_nm * (current_rpm * inv_peak_torque_rpm)
+    else:
+        # Torque decreases more gradually after peak torque RPM
+        rpm_post_peak_k = (current_rpm - peak_torque_rpm) * inv_post_peak_range
+        torque_nm = max_torque_nm * (1 - rpm_post_peak_k * rpm_post_peak_k)
+
+    # Prevent torque from dropping below 30% of max torque
+    return max(torque_nm, min_torque)
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple tick(double current_rpm, double throttle, double target_rpm_k, double max_rpm, double inv_max_rpm,
+                 double peak_torque_rpm, double inv_peak_torque_rpm, double inv_post_peak_range,
+                 double max_torque_nm, double min_torque, double torque_to_hp_k, double max_hp,
+                 double increase_rate, bint clutched):
+    """
+    One simulation step on plain numbers. Returns the new (rpm, torque, hp).
+    See Engine.update_rpm for the model.
+    """
+    # Calculate the target RPM based on throttle and gear ratio
+    cdef double target_rpm = <double><long long>(target_rpm_k * throttle)
+    cdef double rpm = current_rpm
+    cdef double rpm_k, decay_rate, settle_rpm, torque_nm, hp
+
+    if target_rpm > rpm:
+        # Gradual increase to target RPM, slowing down as it approaches the max RPM
+        rpm_k = rpm * inv_max_rpm
+        rpm = min(rpm + (target_rpm - rpm) * increase_rate * (1 - rpm_k * rpm_k), target_rpm)
+    else:
+        # Simulate RPM decay when throttle is released
+        if rpm > 700:
+            if clutched:
+                decay_rate = (rpm - target_rpm) * increase_rate
+            else:
+                decay_rate = (rpm - target_rpm) * increase_rate / 10
+            rpm -= decay_rate
+
+    # Snap to where the RPM settles, the target or max RPM if the target is above it
+    settle_rpm = min(target_rpm, max_rpm)
+    if abs(settle_rpm - rpm) < RPM_SNAP_THRESHOLD:
+        rpm = settle_rpm
+
+    # Keep RPM between idle and maximum
+    rpm = min(max(rpm, 700.0), max_rpm)
+
+    torque_nm = _torque(rpm, peak_torque_rpm, inv_peak_torque_rpm, inv_post_peak_range,
+                        max_torque_nm, min_torque)
+
+    # HP = torque (ft-lb) * RPM / 5252, clamped to max horsepower
+    hp = min(torque_nm * rpm * torque_to_hp_k, max_hp)
+    return rpm, torque_nm, hp
@@ -3,6 +3,52 @@ import pygame.freetype  # For better font rendering
 from Engine import Engine
 from Gearbox import Gearbox
 import math
+import functools
+
+# Fonts, created by _lazy_init() once pygame.freetype is initialized
+_FONT_18 = None
+_FONT_24 = None
+_FONT_24B = None
+
+_PI = math.pi
+
+# Redline starts at 85% of max RPM, the gauge sweeps from pi (0 RPM) to 0 (max RPM)
+_REDLINE_START_ANGLE = _PI * (1.0 - 0.85)
+
+# Gauge ticks every 30 degrees: (degrees, cos, sin, is_major), major ticks every 60 degrees get a label
+_TICK_DEGREES = tuple(range(0, 361, 30))
+_TICK_ANGLES_RAD = tuple(math.radians(i) for i in _TICK_DEGREES)
+_TICKS = [(i, math.cos(angle), math.sin(angle), i % 60 == 0) for i, angle in zip(_TICK_DEGREES, _TICK_ANGLES_RAD)]
+
+def _lazy_init():
+    """
+    Creates the module-level fonts. Must be called after pygame.freetype.init().
+    """
+    global _FONT_18, _FONT_24, _FONT_24B
+    _FONT_18 = pygame.freetype.SysFont('Arial', 18)
+    _FONT_24 = pygame.freetype.SysFont('Arial', 24)
+    _FONT_24B = pygame.freetype.SysFont('Arial', 24, bold=True)
+
+@functools.lru_cache(maxsize=512)
+def _render_text(text: str, size: int, bold: bool, color: tuple) -> pygame.Surface:
+    """
+    Renders text with one of the module-level fonts. Surfaces are cached, so text that
+    doesn't change between frames is only rasterized once.
+
+    :param text: The text to render.
+    :param size: The font size, 18 or 24.
+    :param bold: Whether to use the bold font (only available in size 24).
+    :param color: The text color as an RGB tuple.
+    :return: The rendered text surface.
+    """
+    if size == 18:
+        font = _FONT_18
+    else:
+        font = _FONT_24B if bold else _FONT_24
+    text_surface, _ = font.render(text, color)
+    return text_surface
+
+_slider_backgrounds = {}  # (width, height) -> pre-rendered slider background
 
 def draw_slider(screen, x, y, width, height, value):
     """
@@ -14,83 +60,118 @@ def draw_slider(screen, x, y, width, height, value):
     :param width: The width of the slider.
     :param height: The height of the slider.
     :param value: The current value of the slider (0.0 to 1.0).
+    :return: The screen area that was drawn on.
     """
-    # Draw the slider background
-    pygame.draw.rect(screen, (200, 200, 200), (x, y, width, height))
+    # Draw the slider background, rendered once per slider size
+    background = _slider_backgrounds.get((width, height))
+    if background is None:
+        background = pygame.Surface((width, height))
+        background.fill((200, 200, 200))
+        _slider_backgrounds[(width, height)] = background
+    dirty_rect = screen.blit(background, (x, y))
     
     # Draw the slider bar
     slider_pos = int(x + value * width)
     pygame.draw.rect(screen, (0, 150, 0), (x, y, slider_pos - x, height))
     
     # Draw the slider knob
-    pygame.draw.circle(screen, (0, 100, 0), (slider_pos, y + height // 2), height // 2)
+    knob_rect = pygame.draw.circle(screen, (0, 100, 0), (slider_pos, y + height // 2), height // 2)
+    return dirty_rect.union(knob_rect)
 
-def draw_rpm_gauge(screen, center_x, center_y, radius, rpm, max_rpm):
-    """ 
-    Draws a sleek, modern circular RPM gauge with a needle and redline.
+# Extra space around the gauge disc so the tick labels fit on the background surface
+GAUGE_LABEL_MARGIN = 40
+
+_gauge_backgrounds = {}  # (radius, max_rpm) -> pre-rendered gauge background
+
+def build_rpm_gauge_background(radius, max_rpm):
+    """
+    Renders the static parts of the RPM gauge (disc, border, redline, ticks and labels)
+    onto a transparent surface. The gauge center is at (radius + GAUGE_LABEL_MARGIN,
+    radius + GAUGE_LABEL_MARGIN) on the returned surface.
 
-    :param screen: The Pygame screen to draw on.
-    :param center_x: The x coordinate of the gauge center.
-    :param center_y: The y coordinate of the gauge center.
     :param radius: The radius of the gauge.
-    :param rpm: The current RPM value.
     :param max_rpm: The maximum RPM value.
+    :return: The gauge background surface.
     """
+    center_x = center_y = radius + GAUGE_LABEL_MARGIN
+    surface = pygame.Surface((2 * center_x, 2 * center_y), pygame.SRCALPHA)
+
     # Draw the gauge background
-    gauge_surface = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
-    pygame.draw.circle(gauge_surface, (50, 50, 50), (radius, radius), radius, 0)
-    pygame.draw.circle(gauge_surface, (0, 0, 0), (radius, radius), radius - 2, 0)
-    screen.blit(gauge_surface, (center_x - radius, center_y - radius))
-    
+    pygame.draw.circle(surface, (50, 50, 50), (center_x, center_y), radius, 0)
+    pygame.draw.circle(surface, (0, 0, 0), (center_x, center_y), radius - 2, 0)
+
     # Draw the gauge border
-    pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), radius, 2)
+    pygame.draw.circle(surface, (255, 255, 255), (center_x, center_y), radius, 2)
 
     # Draw the redline area
-    redline_start_rpm = max_rpm * 0.85  # Redline starts at 85% of max RPM
-    redline_start_angle = math.radians(180 - (redline_start_rpm / max_rpm * 180))
-    redline_end_angle = math.radians(180)
-
-    pygame.draw.arc(screen, (255, 0, 0), (center_x - radius, center_y - radius, 2 * radius, 2 * radius),
-                    redline_start_angle, redline_end_angle, 8)
-
-    # Draw the gauge ticks and labels
-    font = pygame.freetype.SysFont('Arial', 18)
-    for i in range(0, 361, 30):
-        angle = math.radians(i)
-        x = center_x + int((radius - 10) * math.cos(angle))
-        y = center_y - int((radius - 10) * math.sin(angle))
-        tick_length = 10 if i % 60 == 0 else 5
-        pygame.draw.line(screen, (255, 255, 255), (x, y), 
-                         (x - tick_length * math.cos(angle), y + tick_length * math.sin(angle)), 2)
+    pygame.draw.arc(surface, (255, 0, 0), (center_x - radius, center_y - radius, 2 * radius, 2 * radius),
+                    _REDLINE_START_ANGLE, _PI, 8)
+
+    # Draw the gauge ticks and labels. This only runs when the background is built, so the
+    # per-tick draw calls don't cost anything per frame. (pygame.draw.lines can't batch them,
+    # it would connect the ticks into one polyline.)
+    for i, cos_a, sin_a, is_major in _TICKS:
+        x = center_x + int((radius - 10) * cos_a)
+        y = center_y - int((radius - 10) * sin_a)
+        tick_length = 10 if is_major else 5
+        pygame.draw.line(surface, (255, 255, 255), (x, y), 
+                         (x - tick_length * cos_a, y + tick_length * sin_a), 2)
         
         # Label RPM ticks
-        if i % 60 == 0:  # Label every 60 degrees
+        if is_major:  # Label every 60 degrees
             label_rpm = int(max_rpm * (i / 360))
             label_text = f"{label_rpm}"
-            text_surface, _ = font.render(label_text, (255, 255, 255))
+            text_surface, _ = _FONT_18.render(label_text, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(x, y - 25))
-            screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+
+    return surface
+
+def draw_rpm_gauge(screen, center_x, center_y, radius, rpm, max_rpm):
+    """ 
+    Draws a sleek, modern circular RPM gauge with a needle and redline.
+
+    :param screen: The Pygame screen to draw on.
+    :param center_x: The x coordinate of the gauge center.
+    :param center_y: The y coordinate of the gauge center.
+    :param radius: The radius of the gauge.
+    :param rpm: The current RPM value.
+    :param max_rpm: The maximum RPM value.
+    :return: The screen area that was drawn on.
+    """
+    # Draw the static gauge background, rendered once per gauge size
+    background = _gauge_backgrounds.get((radius, max_rpm))
+    if background is None:
+        background = build_rpm_gauge_background(radius, max_rpm)
+        _gauge_backgrounds[(radius, max_rpm)] = background
+    offset = radius + GAUGE_LABEL_MARGIN
+    dirty_rect = screen.blit(background, (center_x - offset, center_y - offset))
 
     # Draw the needle with a modern design
-    needle_angle = math.radians(180 - (rpm / max_rpm * 180))
+    needle_angle = _PI * (1.0 - rpm / max_rpm)
     needle_x = center_x + int((radius - 20) * math.cos(needle_angle))
     needle_y = center_y - int((radius - 20) * math.sin(needle_angle))
     pygame.draw.line(screen, (255, 0, 0), (center_x, center_y), (needle_x, needle_y), 4)
     
     # Draw the RPM text in the center
-    font = pygame.freetype.SysFont('Arial', 24, bold=True)
-    rpm_text, _ = font.render(f"{int(rpm)} RPM", (255, 255, 255))
+    rpm_text = _render_text(f"{int(rpm)} RPM", 24, True, (255, 255, 255))
     text_rect = rpm_text.get_rect(center=(center_x, center_y + radius // 2 - 10))
     screen.blit(rpm_text, text_rect)
 
+    # The needle and RPM text are inside the background area
+    return dirty_rect
+
 def main():
     pygame.init()
     pygame.freetype.init()  # Initialize the freetype module for better font rendering
+    _lazy_init()
     
     # Constants
     SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
     WHITE = (255, 255, 255)
     BLACK = (0, 0, 0)
+    DT_PHYS = 1 / 120  # Fixed physics time step in seconds
+    MAX_FRAME_TIME = 0.25  # Longest frame time caught up on, so a stall doesn't freeze the loop
     
     # Create screen
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -110,29 +191,45 @@ def main():
     slider_x, slider_y = 50, 500
     slider_width, slider_height = 300, 20
     slider_value = 0.0
+    # The hit area includes the right edge so the slider can reach exactly 1.0
+    slider_rect = pygame.Rect(slider_x, slider_y, slider_width + 1, slider_height + 1)
 
     gauge_x, gauge_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
     gauge_radius = 150
 
     engine.calculate_increase_rate(gearbox.get_current_ratio())
 
+    # Static background, used to clear the areas that were drawn on in the last frame
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background.fill(WHITE)
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+    last_dirty_rects = []
+    last_frame_state = None
+    accumulator = 0.0
+
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 return
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The window contents were lost, repaint everything on the next frame
+                screen.blit(background, (0, 0))
+                last_frame_state = None
+                pygame.display.flip()
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_x, mouse_y = event.pos
-                if slider_y <= mouse_y <= slider_y + slider_height and slider_x <= mouse_x <= slider_x + slider_width:
-                    slider_value = (mouse_x - slider_x) / slider_width
-                    slider_value = min(max(slider_value, 0.0), 1.0)  # Clamp between 0.0 and 1.0
-                    engine.throttle = slider_value
+                if slider_rect.collidepoint(event.pos):
+                    new_value = min(max((event.pos[0] - slider_x) / slider_width, 0.0), 1.0)  # Clamp between 0.0 and 1.0
+                    if new_value != slider_value:
+                        slider_value = new_value
+                        engine.throttle = new_value
             elif event.type == pygame.MOUSEMOTION and event.buttons[0] == 1:
-                mouse_x, mouse_y = event.pos
-                if slider_y <= mouse_y <= slider_y + slider_height and slider_x <= mouse_x <= slider_x + slider_width:
-                    slider_value = (mouse_x - slider_x) / slider_width
-                    slider_value = min(max(slider_value, 0.0), 1.0)  # Clamp between 0.0 and 1.0
-                    engine.throttle = slider_value
+                if slider_rect.collidepoint(event.pos):
+                    new_value = min(max((event.pos[0] - slider_x) / slider_width, 0.0), 1.0)  # Clamp between 0.0 and 1.0
+                    if new_value != slider_value:
+                        slider_value = new_value
+                        engine.throttle = new_value
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     engine.clutched = True
@@ -146,40 +243,51 @@ def main():
         if engine.clutched == False and engine.throttle != slider_value:
             engine.throttle = slider_value
 
-        engine.update_rpm()
+        # Run the physics at a fixed rate, independent of the render rate
+        accumulator += min(clock.get_time() / 1000, MAX_FRAME_TIME)
+        while accumulator >= DT_PHYS:
+            engine.update_rpm(DT_PHYS)
+            accumulator -= DT_PHYS
 
         # Update the gearbox speed
         speed_kph = gearbox.get_speed(engine.current_rpm)
 
-        # Clear screen
-        screen.fill(WHITE)
+        # Engine data as displayed
+        data_texts = (f"HP: {engine.current_hp:.1f}",
+                      f"Torque: {engine.current_torque_nm:.1f} Nm",
+                      f"Speed: {speed_kph:.1f} km/h",
+                      f"Gear: {gearbox.current_gear}",
+                      f"Pedal Pos: {slider_value:.2f}",
+                      f"Engine Throttle: {engine.throttle:.2f}",
+                      f"Clutched: {engine.clutched}")
+
+        # Nothing on screen changes if none of the displayed values did, skip drawing.
+        # The raw slider value is included for the knob position, it only changes on mouse input.
+        frame_state = (int(engine.current_rpm), data_texts, slider_value)
+        if frame_state == last_frame_state:
+            clock.tick(60)
+            continue
+        last_frame_state = frame_state
+
+        # Clear what was drawn in the last frame
+        for rect in last_dirty_rects:
+            screen.blit(background, rect, rect)
+        dirty_rects = []
 
         # Draw slider
-        draw_slider(screen, slider_x, slider_y, slider_width, slider_height, slider_value)
+        dirty_rects.append(draw_slider(screen, slider_x, slider_y, slider_width, slider_height, slider_value))
 
         # Draw RPM gauge
-        draw_rpm_gauge(screen, gauge_x, gauge_y, gauge_radius, engine.current_rpm, engine.max_rpm)
-
-        # Render engine data
-        font = pygame.freetype.SysFont('Arial', 24)
-        hp_text, _ = font.render(f"HP: {engine.current_hp:.2f}", BLACK)
-        torque_text, _ = font.render(f"Torque: {engine.current_torque_nm:.2f} Nm", BLACK)
-        speed_text, _ = font.render(f"Speed: {speed_kph:.2f} km/h", BLACK)
-        gear_text, _ = font.render(f"Gear: {gearbox.current_gear}", BLACK)
-        pedalpos_text, _ = font.render(f"Pedal Pos: {slider_value:.2f}", BLACK)
-        throttle_text, _ = font.render(f"Engine Throttle: {engine.throttle:.2f}", BLACK)
-        clutched_text, _ = font.render(f"Clutched: {engine.clutched}", BLACK)
+        dirty_rects.append(draw_rpm_gauge(screen, gauge_x, gauge_y, gauge_radius, engine.current_rpm, engine.max_rpm))
 
-        
-        screen.blit(hp_text, (50, 100))
-        screen.blit(torque_text, (50, 150))
-        screen.blit(speed_text, (50, 200))
-        screen.blit(gear_text, (50, 250))
-        screen.blit(pedalpos_text, (50, 300))
-        screen.blit(throttle_text, (50, 350))
-        screen.blit(clutched_text, (50, 400))
-
-        pygame.display.flip()
+        # Render engine data, one line every 50 pixels
+        for i, text in enumerate(data_texts):
+            text_surface = _render_text(text, 24, False, BLACK)
+            dirty_rects.append(screen.blit(text_surface, (50, 100 + 50 * i)))
+
+        # Only push the areas that changed: cleared last frame plus drawn this frame
+        pygame.display.update(last_dirty_rects + dirty_rects)
+        last_dirty_rects = dirty_rects
         clock.tick(60)
 
 if __name__ == "__main__":